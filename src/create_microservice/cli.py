@@ -2,27 +2,89 @@
 
 from __future__ import annotations
 
-import argparse
-import re
+import os
 import sys
-from importlib.metadata import version
-from pathlib import Path
+from types import SimpleNamespace
 
-from create_microservice.scaffold import ScaffoldConfig, create_project
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import argparse
 
 DEFAULT_LIB_SOURCE = "usvc-lib @ git+https://github.com/mcintyjp/microservice-lib.git"
 
 
+class _NormalizeTable(dict):
+    """str.translate table that maps every character outside [a-z0-9] to "_"."""
+
+    def __missing__(self, codepoint: int) -> str:
+        self[codepoint] = "_"
+        return "_"
+
+
+# Spelled out rather than taken from the string module, which imports re
+_NORMALIZE_TABLE = _NormalizeTable({ord(c): c for c in "abcdefghijklmnopqrstuvwxyz0123456789"})
+
+
 def _normalize_name(name: str) -> str:
     """Convert a project name to a valid Python module name.
 
     'my-service' -> 'my_service'
     'My Service' -> 'my_service'
     """
-    return re.sub(r"[^a-z0-9]+", "_", name.lower()).strip("_")
+    normalized = name.lower().translate(_NORMALIZE_TABLE)
+    while "__" in normalized:
+        normalized = normalized.replace("__", "_")
+    return normalized.strip("_")
+
+
+def _get_version() -> str:
+    # importlib.metadata is slow to import, so only load it for --version.
+    from importlib.metadata import version
+
+    return version("create-microservice")
+
+
+def _parse_common_args(argv: list[str]) -> SimpleNamespace | None:
+    """Parse the common ``--name NAME [--no-git]`` invocation by hand.
+
+    Returns None for anything else, which is left to argparse.
+    """
+    if len(argv) not in (2, 3) or argv[0] != "--name" or argv[1].startswith("-"):
+        return None
+    if argv[2:] and argv[2] != "--no-git":
+        return None
+    return SimpleNamespace(
+        name=argv[1],
+        provider="claude",
+        lib_source=DEFAULT_LIB_SOURCE,
+        no_git=len(argv) == 3,
+    )
 
 
 def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    # argparse is slow to import, so only load it when the hand-rolled
+    # parser above can't handle the command line.
+    import argparse
+
+    class _VersionAction(argparse.Action):
+        """Like action="version", but resolves the version only when invoked."""
+
+        def __init__(
+            self, option_strings: list[str], dest: str = argparse.SUPPRESS, **kwargs
+        ) -> None:
+            super().__init__(
+                option_strings=option_strings,
+                dest=dest,
+                default=argparse.SUPPRESS,
+                nargs=0,
+                help="show program's version number and exit",
+                **kwargs,
+            )
+
+        def __call__(self, parser, namespace, values, option_string=None) -> None:
+            print(f"{parser.prog} {_get_version()}")
+            parser.exit()
+
     parser = argparse.ArgumentParser(
         prog="create-microservice",
         description="Scaffold a new usvc-lib microservice project.",
@@ -50,35 +112,51 @@ def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     )
     parser.add_argument(
         "--version",
-        action="version",
-        version=f"%(prog)s {version('create-microservice')}",
+        action=_VersionAction,
     )
     return parser.parse_args(argv)
 
 
 def main(argv: list[str] | None = None) -> None:
-    args = _parse_args(argv)
+    if argv is None:
+        argv = sys.argv[1:]
+
+    # Answer a bare --version without building the argument parser
+    if argv == ["--version"]:
+        print(f"create-microservice {_get_version()}")
+        return
+
+    args = _parse_common_args(argv) or _parse_args(argv)
 
     project_name = args.name
     module_name = _normalize_name(project_name)
 
-    if not re.match(r"^[a-z_][a-z0-9_]*$", module_name):
+    # _normalize_name leaves only [a-z0-9_], so this only rejects empty or
+    # digit-leading names
+    if not module_name.isidentifier():
         print(
             f"Error: '{project_name}' cannot be converted to a valid Python module name.",
             file=sys.stderr,
         )
         sys.exit(1)
 
-    target_dir = Path.cwd() / module_name
+    # Plain os.path keeps pathlib off the early-exit paths
+    target_dir = os.path.join(os.getcwd(), module_name)
 
-    if target_dir.exists():
+    if os.path.exists(target_dir):
         print(f"Error: directory '{target_dir}' already exists.", file=sys.stderr)
         sys.exit(1)
 
+    # Deferred so --help, --version and argument errors skip loading the
+    # scaffolding engine and its templates.
+    from pathlib import Path
+
+    from create_microservice.scaffold import ScaffoldConfig, create_project
+
     config = ScaffoldConfig(
         project_name=project_name,
         module_name=module_name,
-        target_dir=target_dir,
+        target_dir=Path(target_dir),
         provider=args.provider,
         usvc_lib_dependency=args.lib_source,
         init_git=not args.no_git,
@@ -2,22 +2,24 @@
 
 from __future__ import annotations
 
+import os
 import shutil
 import subprocess
 import sys
 from dataclasses import dataclass
+from itertools import chain
 from pathlib import Path
 
 from create_microservice.templates import (
     CLAUDE_MANIFEST,
     COPILOT_MANIFEST,
     MANIFEST,
-    render,
+    copy_asset,
+    render_bytes,
 )
-from create_microservice.templates import agent_md, developer_guide_md
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class ScaffoldConfig:
     project_name: str
     module_name: str
@@ -27,6 +29,15 @@ class ScaffoldConfig:
     init_git: bool = True
 
 
+# O_BINARY keeps Windows from translating newlines on raw descriptors.
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC | getattr(os, "O_BINARY", 0)
+
+_COMMIT_MESSAGE = "Initial scaffold from create-microservice"
+
+# Resolved once so each spawn gets an absolute path and skips the PATH walk.
+_GIT = shutil.which("git")
+
+
 def create_project(config: ScaffoldConfig) -> None:
     """Create a complete microservice project from templates."""
     template_vars = {
@@ -35,70 +46,145 @@ def create_project(config: ScaffoldConfig) -> None:
         "usvc_lib_dependency": config.usvc_lib_dependency,
     }
 
-    # Write base manifest files
-    for template_module, path_template in MANIFEST:
-        rel_path = path_template.format(**template_vars)
-        _write_file(config.target_dir, rel_path, render(template_module, **template_vars))
-
-    # Write provider-specific files
-    if config.provider == "claude":
-        provider_manifest = CLAUDE_MANIFEST
-    elif config.provider == "copilot":
-        provider_manifest = COPILOT_MANIFEST
-    else:
-        provider_manifest = []
-
-    for template_module, path_template in provider_manifest:
-        rel_path = path_template.format(**template_vars)
-        _write_file(config.target_dir, rel_path, render(template_module, **template_vars))
-
-    # Write static library docs
-    _write_file(config.target_dir, "AGENT.md", agent_md.CONTENT)
-    _write_file(config.target_dir, "DEVELOPER_GUIDE.md", developer_guide_md.CONTENT)
-
-    # Copy .env.example to .env
-    env_example = config.target_dir / ".env.example"
-    env_file = config.target_dir / ".env"
-    if env_example.exists():
-        shutil.copy2(env_example, env_file)
-
-    # Git init
-    if config.init_git:
-        _git_init(config.target_dir)
+    # git init needs none of our files, so let it run while they are written
+    git_init = _start_git_init(config.target_dir) if config.init_git else None
+
+    try:
+        # Select provider-specific files
+        if config.provider == "claude":
+            provider_manifest = CLAUDE_MANIFEST
+        elif config.provider == "copilot":
+            provider_manifest = COPILOT_MANIFEST
+        else:
+            provider_manifest = ()
+
+        # Resolve paths and render contents for every file in a single pass
+        entries = [
+            (
+                config.target_dir / path_template.format_map(template_vars),
+                render_bytes(template_name, **template_vars),
+            )
+            for template_name, path_template in chain(MANIFEST, provider_manifest)
+        ]
+
+        # .env starts out identical to .env.example, so write the same content
+        entries += [
+            (path.with_name(".env"), content)
+            for path, content in entries
+            if path.name == ".env.example"
+        ]
+
+        # Create each directory once, instead of per file
+        created_dirs: set[Path] = set()
+        for parent in {path.parent for path, _ in entries}:
+            _make_dir(parent, created_dirs)
+
+        _write_entries(entries)
+
+        # Static library docs are not templates; copy them straight from package data
+        copy_asset("agent_md.md", config.target_dir / "AGENT.md")
+        copy_asset("developer_guide_md.md", config.target_dir / "DEVELOPER_GUIDE.md")
+
+        # Git add + initial commit
+        if git_init is not None:
+            _git_commit(config.target_dir, git_init)
+    finally:
+        # If anything above failed before the commit step, don't leave git
+        # init running with its stderr pipe open
+        if git_init is not None and git_init.returncode is None:
+            git_init.kill()
+            git_init.communicate()
 
     # Print next steps
     _print_next_steps(config)
 
 
-def _write_file(base_dir: Path, rel_path: str, content: str) -> None:
-    """Write content to a file, creating parent directories as needed."""
-    file_path = base_dir / rel_path
-    file_path.parent.mkdir(parents=True, exist_ok=True)
-    file_path.write_text(content, encoding="utf-8")
+def _write_entries(entries: list[tuple[Path, bytes]]) -> None:
+    """Write rendered files whose parent directories already exist."""
+    for path, content in entries:
+        _write_bytes(path, content)
 
 
-def _git_init(target_dir: Path) -> None:
-    """Initialize a git repo and create an initial commit."""
+def _write_bytes(path: Path, content: bytes) -> None:
+    """Write content to path with raw os calls, bypassing Python's buffered I/O."""
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        # os.write may write less than asked for; keep going until it's all out
+        view = memoryview(content)
+        while view:
+            view = view[os.write(fd, view) :]
+    finally:
+        os.close(fd)
+
+
+def _make_dir(directory: Path, created: set[Path]) -> None:
+    """Create directory and any missing ancestors, skipping ones in created.
+
+    Unlike Path.mkdir(parents=True, exist_ok=True), this costs a single
+    os.mkdir for a directory whose parent exists, and nothing at all for one
+    already recorded in created.
+    """
+    if directory in created:
+        return
     try:
-        subprocess.run(["git", "init"], cwd=target_dir, check=True, capture_output=True)
-        subprocess.run(["git", "add", "."], cwd=target_dir, check=True, capture_output=True)
-        subprocess.run(
-            ["git", "commit", "-m", "Initial scaffold from create-microservice"],
-            cwd=target_dir,
-            check=True,
-            capture_output=True,
+        os.mkdir(directory)
+    except FileNotFoundError:
+        _make_dir(directory.parent, created)
+        os.mkdir(directory)
+    except FileExistsError:
+        if not directory.is_dir():
+            raise
+    created.add(directory)
+
+
+def _start_git_init(target_dir: Path) -> subprocess.Popen[bytes] | None:
+    """Create target_dir and start ``git init`` in it without waiting."""
+    if _GIT is None:
+        print("Warning: git not found on PATH. Skipping git init.", file=sys.stderr)
+        return None
+    target_dir.mkdir(parents=True, exist_ok=True)
+    # Absolute executables and no cwd= (we use git -C instead) let
+    # CPython spawn via posix_spawn rather than fork+exec.
+    try:
+        return subprocess.Popen(
+            [_GIT, "-C", str(target_dir), "init", "--quiet"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
         )
-    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+    except FileNotFoundError as e:
         print(f"Warning: git init failed ({e}). Skipping.", file=sys.stderr)
+        return None
+
+
+def _git_commit(target_dir: Path, git_init: subprocess.Popen[bytes]) -> None:
+    """Wait for ``git init`` to finish, then stage everything and commit."""
+    try:
+        _, stderr = git_init.communicate()
+        if git_init.returncode:
+            raise subprocess.CalledProcessError(git_init.returncode, git_init.args, stderr=stderr)
+        for args in (["add", "."], ["commit", "-m", _COMMIT_MESSAGE]):
+            subprocess.run(
+                [_GIT, "-C", str(target_dir), *args],
+                check=True,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+            )
+    except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        # stdout goes to DEVNULL; stderr is only piped so failures can explain themselves
+        stderr = getattr(e, "stderr", None)
+        detail = stderr.decode(errors="replace").strip() if stderr else e
+        print(f"Warning: git init failed ({detail}). Skipping.", file=sys.stderr)
 
 
 def _print_next_steps(config: ScaffoldConfig) -> None:
     """Print instructions for getting started."""
-    print(f"\nCreated project: {config.project_name}")
-    print(f"  Directory: {config.target_dir}\n")
-    print("Next steps:")
-    print(f"  cd {config.target_dir.name}")
-    print("  uv sync")
-    print("  # Edit .env as needed")
-    print(f"  uv run python -m {config.module_name}.main")
-    print(f"  uv run pytest tests/ -v")
+    sys.stdout.write(
+        f"\nCreated project: {config.project_name}\n"
+        f"  Directory: {config.target_dir}\n\n"
+        "Next steps:\n"
+        f"  cd {config.target_dir.name}\n"
+        "  uv sync\n"
+        "  # Edit .env as needed\n"
+        f"  uv run python -m {config.module_name}.main\n"
+        "  uv run pytest tests/ -v\n"
+    )
@@ -1,60 +1,172 @@
-"""Template modules and manifest for project scaffolding."""
+"""Template modules and manifest for project scaffolding.
+
+Template modules expose a CONTENT string using string.Template syntax
+(``$name`` / ``${name}``, ``$$`` for a literal dollar sign). On first render
+each template is translated into an f-string and compiled, so rendering is
+a single evaluation of that code object.
+"""
 
 from __future__ import annotations
 
+import importlib
+import os
+import shutil
+import sys
+from functools import lru_cache
+from importlib.resources import as_file, files
+from pathlib import Path
 from string import Template
+from types import CodeType, ModuleType
 
-from create_microservice.templates import (
-    action_handler,
-    action_schema,
-    claude_md,
-    claude_settings,
-    config_py,
-    conftest_py,
-    copilot_md,
-    env_example,
-    gitignore,
-    init_py,
-    main_py,
-    pyproject_toml,
-    readme,
-    service_example,
-    test_example,
-)
-
-# (template_module, relative_path_template)
+# (template_name, relative_path_template)
+# Template names are submodules of this package, imported on first render.
 # Paths can contain {module_name} for project-specific paths.
-MANIFEST: list[tuple[object, str]] = [
-    (pyproject_toml, "pyproject.toml"),
-    (readme, "README.md"),
-    (gitignore, ".gitignore"),
-    (env_example, ".env.example"),
-    (main_py, "src/{module_name}/main.py"),
-    (config_py, "src/{module_name}/config.py"),
-    (init_py, "src/{module_name}/__init__.py"),
-    (action_handler, "src/actions/hello_world/handler.py"),
-    (action_schema, "src/actions/hello_world/schemas.py"),
-    (init_py, "src/actions/__init__.py"),
-    (init_py, "src/actions/hello_world/__init__.py"),
-    (service_example, "src/services/example_api.py"),
-    (init_py, "src/services/__init__.py"),
-    (conftest_py, "tests/conftest.py"),
-    (test_example, "tests/test_hello_world.py"),
-    (init_py, "tests/__init__.py"),
+MANIFEST: list[tuple[str, str]] = [
+    ("pyproject_toml", "pyproject.toml"),
+    ("readme", "README.md"),
+    ("gitignore", ".gitignore"),
+    ("env_example", ".env.example"),
+    ("main_py", "src/{module_name}/main.py"),
+    ("config_py", "src/{module_name}/config.py"),
+    ("init_py", "src/{module_name}/__init__.py"),
+    ("action_handler", "src/actions/hello_world/handler.py"),
+    ("action_schema", "src/actions/hello_world/schemas.py"),
+    ("init_py", "src/actions/__init__.py"),
+    ("init_py", "src/actions/hello_world/__init__.py"),
+    ("service_example", "src/services/example_api.py"),
+    ("init_py", "src/services/__init__.py"),
+    ("conftest_py", "tests/conftest.py"),
+    ("test_example", "tests/test_hello_world.py"),
+    ("init_py", "tests/__init__.py"),
 ]
 
 # Provider-specific files
-CLAUDE_MANIFEST: list[tuple[object, str]] = [
-    (claude_md, "CLAUDE.md"),
-    (claude_settings, ".claude/settings.json"),
+CLAUDE_MANIFEST: list[tuple[str, str]] = [
+    ("claude_md", "CLAUDE.md"),
+    ("claude_settings", ".claude/settings.json"),
 ]
 
-COPILOT_MANIFEST: list[tuple[object, str]] = [
-    (copilot_md, ".github/copilot-instructions.md"),
+COPILOT_MANIFEST: list[tuple[str, str]] = [
+    ("copilot_md", ".github/copilot-instructions.md"),
 ]
 
 
-def render(template_module: object, **kwargs: str) -> str:
+# Compiled templates keyed by template name: an f-string code object for
+# templates with placeholders, or the plain CONTENT for templates without.
+_TEMPLATE_CACHE: dict[str, str | CodeType] = {}
+
+# Compiled f-strings only reference placeholder names, so they need no builtins.
+_EVAL_GLOBALS: dict[str, object] = {"__builtins__": {}}
+
+# UTF-8 encoded CONTENT of the placeholder-free templates.
+_STATIC_BYTES: dict[str, bytes] = {}
+
+# The only names a template may reference; compiled code can read nothing else.
+_PLACEHOLDERS = frozenset({"project_name", "module_name", "usvc_lib_dependency"})
+
+
+def load_template(name: str) -> ModuleType:
+    """Return the template submodule called ``name``, importing it if needed."""
+    qualified = f"{__name__}.{name}"
+    return sys.modules.get(qualified) or importlib.import_module(qualified)
+
+
+def copy_asset(filename: str, destination: Path) -> None:
+    """Copy a data file shipped in this package to destination.
+
+    shutil.copyfile uses the OS's in-kernel copy where it can (sendfile on
+    Linux, fcopyfile on macOS), so the contents never pass through Python.
+    The copy goes to a temporary sibling that is renamed into place, so an
+    interrupted run never leaves a truncated destination behind.
+    """
+    tmp = destination.with_name(f"{destination.name}.tmp")
+    try:
+        with as_file(files(__name__).joinpath(filename)) as source:
+            shutil.copyfile(source, tmp)
+        os.replace(tmp, destination)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+
+
+def _to_format_string(content: str) -> str:
+    """Translate string.Template syntax into str.format / f-string syntax."""
+    parts = []
+    pos = 0
+    for match in Template.pattern.finditer(content):
+        parts.append(content[pos : match.start()].replace("{", "{{").replace("}", "}}"))
+        name = match["named"] or match["braced"]
+        if name is not None:
+            if name not in _PLACEHOLDERS:
+                raise ValueError(
+                    f"Unknown placeholder ${name} in template at index {match.start()}"
+                )
+            parts.append(f"{{{name}}}")
+        elif match["escaped"] is not None:
+            parts.append("$")
+        else:
+            raise ValueError(f"Invalid placeholder in template at index {match.start()}")
+        pos = match.end()
+    parts.append(content[pos:].replace("{", "{{").replace("}", "}}"))
+    return "".join(parts)
+
+
+def _compile(template_name: str) -> str | CodeType:
+    compiled = _TEMPLATE_CACHE.get(template_name)
+    if compiled is None:
+        content: str = load_template(template_name).CONTENT
+        if "$" in content:
+            # Placeholders are allowlisted identifiers and everything else is a
+            # repr()-escaped literal, so the f-string can only look up names.
+            source = "f" + repr(_to_format_string(content))
+            compiled = compile(source, f"<template {template_name}>", "eval")
+        else:
+            compiled = content
+        _TEMPLATE_CACHE[template_name] = compiled
+    return compiled
+
+
+def _evaluate(template_name: str, variables: dict[str, object]) -> str:
+    try:
+        return eval(_compile(template_name), _EVAL_GLOBALS, variables)
+    except NameError as e:
+        raise KeyError(e.name) from None
+
+
+@lru_cache(maxsize=32)
+def _evaluate_cached(template_name: str, items: tuple[tuple[str, object], ...]) -> str:
+    return _evaluate(template_name, dict(items))
+
+
+def _substitute(template_name: str, variables: dict[str, object]) -> str:
+    # Memoized so repeat scaffolds with the same variables reuse the output
+    items = tuple(sorted(variables.items()))
+    try:
+        hash(items)
+    except TypeError:
+        # Unhashable values can't key the cache, so render them uncached
+        return _evaluate(template_name, variables)
+    return _evaluate_cached(template_name, items)
+
+
+def render(template_name: str, **kwargs: str) -> str:
     """Render a template module's CONTENT with the given variables."""
-    content: str = getattr(template_module, "CONTENT")
-    return Template(content).substitute(**kwargs)
+    compiled = _compile(template_name)
+    if isinstance(compiled, str):
+        return compiled
+    return _substitute(template_name, kwargs)
+
+
+def render_bytes(template_name: str, **kwargs: str) -> bytes:
+    """Render a template module's CONTENT to UTF-8 bytes.
+
+    Placeholder-free templates are encoded once and then served from cache.
+    """
+    static = _STATIC_BYTES.get(template_name)
+    if static is not None:
+        return static
+    compiled = _compile(template_name)
+    if not isinstance(compiled, str):
+        return _substitute(template_name, kwargs).encode("utf-8")
+    static = _STATIC_BYTES[template_name] = compiled.encode("utf-8")
+    return static
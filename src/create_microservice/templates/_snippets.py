@@ -0,0 +1,7 @@
+"""Command snippets shared by several templates.
+
+Snippets use the same string.Template placeholders as template CONTENT.
+"""
+
+UV_RUN_SERVICE = "uv run python -m $module_name.main"
+UV_RUN_TESTS = "uv run pytest tests/ -v"
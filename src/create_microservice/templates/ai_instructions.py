@@ -1,6 +1,8 @@
 """Shared AI assistant instructions for Claude and Copilot providers."""
 
-CONTENT = """\
+from create_microservice.templates._snippets import UV_RUN_SERVICE, UV_RUN_TESTS
+
+CONTENT = f"""\
 # $project_name
 
 ## Architecture
@@ -10,12 +12,13 @@ This is a microservice built with `usvc-lib`. It uses a job queue pattern:
 - Each action has a `handler.py` (with `@action` decorator) and `schemas.py` (Pydantic input model)
 - Services in `src/services/` provide external API clients (extend `RestAPIService`)
 - Configuration is loaded from `.env` via `WorkerSettings` (pydantic-settings)
+- Read settings with `get_settings()` from `$module_name.config`; don't instantiate `Settings()` directly
 
 ## Key Commands
 
 ```bash
-uv run python -m $module_name.main    # Run the service
-uv run pytest tests/ -v                # Run tests
+{UV_RUN_SERVICE}    # Run the service
+{UV_RUN_TESTS}                # Run tests
 ```
 
 ## Adding a New Action
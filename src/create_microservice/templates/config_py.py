@@ -5,12 +5,22 @@ Add environment variables specific to this microservice below.
 All base settings (MICROSERVICE_NAME, DEV_MODE, etc.) are inherited.
 \"\"\"
 
+from functools import lru_cache
+
 from usvc_lib import WorkerSettings
 
 
 class Settings(WorkerSettings):
+    # Build the validator on first use rather than at import time
+    model_config = {"defer_build": True}
+
     # Add your custom environment variables here, e.g.:
     # MY_API_KEY: str = ""
     # CUSTOM_TIMEOUT: int = 30
-    pass
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    \"\"\"Return the shared Settings instance, loading it on first call.\"\"\"
+    return Settings()
 """
@@ -1,4 +1,8 @@
-CONTENT = """\
+"""README.md template."""
+
+from create_microservice.templates._snippets import UV_RUN_SERVICE, UV_RUN_TESTS
+
+CONTENT = f"""\
 # $project_name
 
 A microservice built with [usvc-lib](https://github.com/mcintyjp/microservice-lib).
@@ -24,6 +28,25 @@ This updates the lock file with the latest commit from the library's repository
 
 ## Configuration
 
+Add service-specific settings to the `Settings` class in `src/$module_name/config.py`:
+
+```python
+class Settings(WorkerSettings):
+    model_config = {{"defer_build": True}}
+
+    CUSTOM_TIMEOUT: int = 30
+```
+
+In handlers and services, read them with `get_settings()`. It caches one `Settings`
+instance that all your code shares, instead of re-parsing the environment on every
+`Settings()` call. (`Application` still builds its own instance from `settings_class`.)
+
+```python
+from $module_name.config import get_settings
+
+timeout = get_settings().CUSTOM_TIMEOUT
+```
+
 ### OpenTelemetry (Optional)
 
 To enable distributed tracing and logging, configure these environment variables in `.env`:
@@ -38,13 +61,13 @@ These credentials are used when your OpenTelemetry collector requires HTTP basic
 ## Run
 
 ```bash
-uv run python -m $module_name.main
+{UV_RUN_SERVICE}
 ```
 
 ## Test
 
 ```bash
-uv run pytest tests/ -v
+{UV_RUN_TESTS}
 ```
 
 ## Adding Actions
@@ -1,8 +1,11 @@
 """Tests for the CLI module."""
 
+import subprocess
+import sys
+
 import pytest
 
-from create_microservice.cli import _normalize_name, _parse_args
+from create_microservice.cli import _normalize_name, _parse_args, _parse_common_args
 
 
 class TestNormalizeName:
@@ -24,6 +27,12 @@ class TestNormalizeName:
     def test_strips_leading_trailing(self):
         assert _normalize_name("-my-service-") == "my_service"
 
+    def test_collapses_separator_runs(self):
+        assert _normalize_name("my--__. service") == "my_service"
+
+    def test_non_ascii_becomes_separator(self):
+        assert _normalize_name("Café Σervice") == "caf_ervice"
+
 
 class TestParseArgs:
     def test_version_flag(self, capsys):
@@ -58,6 +67,86 @@ class TestParseArgs:
             _parse_args(["--name", "svc", "--provider", "invalid"])
 
 
+class TestParseCommonArgs:
+    @pytest.mark.parametrize(
+        "argv", [["--name", "my-service"], ["--name", "my-service", "--no-git"]]
+    )
+    def test_matches_argparse(self, argv):
+        assert vars(_parse_common_args(argv)) == vars(_parse_args(argv))
+
+    @pytest.mark.parametrize(
+        "argv",
+        [
+            [],
+            ["--name"],
+            ["--name=svc"],
+            ["--name", "--no-git"],
+            ["--name", "svc", "--provider", "copilot"],
+            ["--name", "svc", "--no-gi"],
+            ["--no-git", "--name", "svc"],
+        ],
+    )
+    def test_other_invocations_fall_through(self, argv):
+        assert _parse_common_args(argv) is None
+
+
+class TestMainVersion:
+    def test_version_fast_path(self, capsys):
+        from importlib.metadata import version
+
+        from create_microservice.cli import main
+
+        main(["--version"])
+        assert capsys.readouterr().out == f"create-microservice {version('create-microservice')}\n"
+
+
+def _modules_loaded_by_main(
+    argv, cwd=None, prefixes=("create_microservice.scaffold", "create_microservice.templates")
+):
+    """Run main(argv) in a fresh interpreter; return the heavy modules it imported."""
+    code = (
+        "import sys\n"
+        "from create_microservice.cli import main\n"
+        "try:\n"
+        f"    main({argv!r})\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        f"loaded = [m for m in sys.modules if m.startswith({tuple(prefixes)!r})]\n"
+        "print(loaded, file=sys.stderr)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True, cwd=cwd
+    )
+    return result.stderr.strip().splitlines()[-1]
+
+
+class TestLazyImports:
+    def test_help_does_not_load_scaffold_or_templates(self):
+        assert _modules_loaded_by_main(["--help"]) == "[]"
+
+    @pytest.mark.parametrize("name", ["123-service", "..."])
+    def test_invalid_name_does_not_load_scaffold(self, name, tmp_path):
+        assert _modules_loaded_by_main(["--name", name], cwd=tmp_path) == "[]"
+
+    def test_existing_directory_does_not_load_scaffold(self, tmp_path):
+        (tmp_path / "existing_project").mkdir()
+        assert _modules_loaded_by_main(["--name", "existing-project"], cwd=tmp_path) == "[]"
+
+    def test_common_invocation_does_not_load_argparse(self, tmp_path):
+        (tmp_path / "existing_project").mkdir()
+        loaded = _modules_loaded_by_main(
+            ["--name", "existing-project", "--no-git"], cwd=tmp_path, prefixes=("argparse",)
+        )
+        assert loaded == "[]"
+
+    def test_existing_directory_check_does_not_load_pathlib(self, tmp_path):
+        (tmp_path / "existing_project").mkdir()
+        loaded = _modules_loaded_by_main(
+            ["--name", "existing-project"], cwd=tmp_path, prefixes=("pathlib",)
+        )
+        assert loaded == "[]"
+
+
 class TestMainExistingDir:
     def test_existing_directory_exits(self, tmp_path, monkeypatch):
         """main() should exit with error if target directory already exists."""
@@ -1,7 +1,12 @@
 """Tests for the scaffolding engine."""
 
+import shutil
+from dataclasses import replace
+from importlib.resources import files
+
 import pytest
 
+from create_microservice import scaffold
 from create_microservice.scaffold import ScaffoldConfig, create_project
 
 
@@ -45,6 +50,16 @@ class TestCreateProject:
         for rel_path in expected_files:
             assert (root / rel_path).exists(), f"Missing: {rel_path}"
 
+    def test_creates_missing_ancestors_of_target(self, tmp_path):
+        config = ScaffoldConfig(
+            project_name="nested",
+            module_name="nested",
+            target_dir=tmp_path / "a" / "b" / "nested",
+            init_git=False,
+        )
+        create_project(config)
+        assert (config.target_dir / "src" / "actions" / "hello_world" / "handler.py").exists()
+
     def test_env_is_copy_of_example(self, config):
         create_project(config)
         root = config.target_dir
@@ -53,6 +68,16 @@ class TestCreateProject:
         env_content = (root / ".env").read_text()
         assert example_content == env_content
 
+    def test_static_docs_written_verbatim(self, config):
+        create_project(config)
+        root = config.target_dir
+
+        package_data = files("create_microservice.templates")
+        agent_md = (root / "AGENT.md").read_bytes()
+        assert agent_md == package_data.joinpath("agent_md.md").read_bytes()
+        guide = (root / "DEVELOPER_GUIDE.md").read_bytes()
+        assert guide == package_data.joinpath("developer_guide_md.md").read_bytes()
+
     def test_pyproject_contains_project_name(self, config):
         create_project(config)
         content = (config.target_dir / "pyproject.toml").read_text()
@@ -76,11 +101,55 @@ class TestCreateProject:
         content = (config.target_dir / "src" / "test_service" / "config.py").read_text()
         assert "from usvc_lib import WorkerSettings" in content
         assert "class Settings(WorkerSettings):" in content
+        assert 'model_config = {"defer_build": True}' in content
+        assert "pydantic_settings" not in content
+        assert "def get_settings() -> Settings:" in content
+
+    def test_prints_next_steps(self, config, capsys):
+        create_project(config)
+        out = capsys.readouterr().out
+        assert out.startswith("\nCreated project: test-service\n")
+        assert f"  cd {config.target_dir.name}\n" in out
+        assert out.endswith("  uv run python -m test_service.main\n  uv run pytest tests/ -v\n")
+
+
+class TestGitInit:
+    def test_missing_git_warns_and_skips(self, config, monkeypatch, capsys):
+        monkeypatch.setattr("create_microservice.scaffold._GIT", None)
+        config = replace(config, init_git=True)
+        create_project(config)
+
+        assert "git not found" in capsys.readouterr().err
+        assert (config.target_dir / "pyproject.toml").exists()
+        assert not (config.target_dir / ".git").exists()
+
+    @pytest.mark.skipif(shutil.which("git") is None, reason="git not installed")
+    def test_failed_write_reaps_git_init(self, config, monkeypatch):
+        started = []
+        start_git_init = scaffold._start_git_init
+
+        def spy(target_dir):
+            started.append(start_git_init(target_dir))
+            return started[-1]
+
+        def fail(entries):
+            raise OSError("disk full")
+
+        monkeypatch.setattr(scaffold, "_start_git_init", spy)
+        monkeypatch.setattr(scaffold, "_write_entries", fail)
+        config = replace(config, init_git=True)
+
+        with pytest.raises(OSError, match="disk full"):
+            create_project(config)
+
+        (git_init,) = started
+        assert git_init.returncode is not None
+        assert git_init.stderr.closed
 
 
 class TestProviderFiles:
     def test_claude_provider_creates_claude_files(self, config):
-        config.provider = "claude"
+        config = replace(config, provider="claude")
         create_project(config)
         root = config.target_dir
 
@@ -89,7 +158,7 @@ class TestProviderFiles:
         assert not (root / ".github" / "copilot-instructions.md").exists()
 
     def test_copilot_provider_creates_copilot_files(self, config):
-        config.provider = "copilot"
+        config = replace(config, provider="copilot")
         create_project(config)
         root = config.target_dir
 
@@ -98,7 +167,7 @@ class TestProviderFiles:
         assert not (root / ".claude").exists()
 
     def test_claude_md_contains_module_name(self, config):
-        config.provider = "claude"
+        config = replace(config, provider="claude")
         create_project(config)
         content = (config.target_dir / "CLAUDE.md").read_text()
         assert "test_service" in content
@@ -132,3 +201,9 @@ class TestGeneratedPythonValidity:
                 compile(source, str(py_file), "exec")
             except SyntaxError as e:
                 pytest.fail(f"Syntax error in {py_file}: {e}")
+
+
+class TestScaffoldConfig:
+    def test_config_is_immutable(self, config):
+        with pytest.raises(AttributeError):
+            config.provider = "copilot"
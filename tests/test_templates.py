@@ -1,12 +1,19 @@
 """Tests for template modules."""
 
+import subprocess
+import sys
+import types
+
 import pytest
 
 from create_microservice.templates import (
     CLAUDE_MANIFEST,
     COPILOT_MANIFEST,
     MANIFEST,
+    copy_asset,
+    load_template,
     render,
+    render_bytes,
 )
 
 
@@ -19,37 +26,91 @@ TEMPLATE_VARS = {
 
 class TestTemplateRendering:
     @pytest.mark.parametrize(
-        "template_module,path_template",
+        "template_name,path_template",
         MANIFEST + CLAUDE_MANIFEST + COPILOT_MANIFEST,
         ids=lambda x: x if isinstance(x, str) else getattr(x, "__name__", str(x)),
     )
-    def test_no_unresolved_placeholders(self, template_module, path_template):
+    def test_no_unresolved_placeholders(self, template_name, path_template):
         """Template placeholders should all be resolved after rendering."""
-        rendered = render(template_module, **TEMPLATE_VARS)
+        rendered = render(template_name, **TEMPLATE_VARS)
         # Check for unresolved $variable placeholders (string.Template syntax)
         for var_name in TEMPLATE_VARS:
             assert f"${var_name}" not in rendered, (
                 f"Unresolved placeholder ${var_name} in {path_template}"
             )
 
+    @pytest.mark.parametrize(
+        "template_name,path_template",
+        MANIFEST + CLAUDE_MANIFEST + COPILOT_MANIFEST,
+        ids=lambda x: x if isinstance(x, str) else getattr(x, "__name__", str(x)),
+    )
+    def test_render_bytes_matches_render(self, template_name, path_template):
+        """render_bytes() should be the UTF-8 encoding of render()."""
+        expected = render(template_name, **TEMPLATE_VARS).encode("utf-8")
+        assert render_bytes(template_name, **TEMPLATE_VARS) == expected
+
+    def test_repeat_render_is_memoized(self):
+        first = render("pyproject_toml", **TEMPLATE_VARS)
+        assert render("pyproject_toml", **TEMPLATE_VARS) is first
+        assert render("pyproject_toml", **{**TEMPLATE_VARS, "project_name": "other"}) != first
+
+    def test_unhashable_values_bypass_memoization(self):
+        rendered = render("env_example", project_name=["svc"])
+        assert "MICROSERVICE_NAME=['svc']" in rendered
+
+
+class TestTemplateSyntax:
+    @pytest.fixture
+    def fake_template(self, request, monkeypatch):
+        """Register an ad-hoc template module and return its name."""
+        # Renders are cached by name, so every test gets its own module
+        name = f"fake_{request.node.name}"
+        module = types.ModuleType(f"create_microservice.templates.{name}")
+        monkeypatch.setitem(sys.modules, module.__name__, module)
+        return name, module
+
+    def test_literal_braces_and_escaped_dollar(self, fake_template):
+        name, module = fake_template
+        module.CONTENT = 'x = {"n": "$project_name"}  # ${module_name}.main costs $$5\n'
+        assert render(name, **TEMPLATE_VARS) == (
+            'x = {"n": "test-service"}  # test_service.main costs $5\n'
+        )
+
+    def test_quotes_and_backslashes_survive(self, fake_template):
+        name, module = fake_template
+        module.CONTENT = 'r"""\\d+""" \'$module_name\' \\n\n'
+        assert render(name, **TEMPLATE_VARS) == 'r"""\\d+""" \'test_service\' \\n\n'
+
+    def test_missing_variable_raises(self, fake_template):
+        name, module = fake_template
+        module.CONTENT = "$project_name $module_name\n"
+        with pytest.raises(KeyError):
+            render(name, project_name="test-service")
+
+    def test_unknown_placeholder_rejected(self, fake_template):
+        name, module = fake_template
+        module.CONTENT = "$project_name $undefined_var\n"
+        with pytest.raises(ValueError, match="undefined_var"):
+            render(name, **TEMPLATE_VARS)
+
 
 class TestPythonTemplateSyntax:
     """Verify that templates producing Python files are syntactically valid."""
 
     PYTHON_TEMPLATES = [
-        (mod, path)
-        for mod, path in MANIFEST + CLAUDE_MANIFEST + COPILOT_MANIFEST
+        (name, path)
+        for name, path in MANIFEST + CLAUDE_MANIFEST + COPILOT_MANIFEST
         if path.endswith(".py")
     ]
 
     @pytest.mark.parametrize(
-        "template_module,path_template",
+        "template_name,path_template",
         PYTHON_TEMPLATES,
         ids=lambda x: x if isinstance(x, str) else getattr(x, "__name__", str(x)),
     )
-    def test_python_compile(self, template_module, path_template):
+    def test_python_compile(self, template_name, path_template):
         """Rendered Python templates should pass compile()."""
-        rendered = render(template_module, **TEMPLATE_VARS)
+        rendered = render(template_name, **TEMPLATE_VARS)
         compile(rendered, path_template, "exec")
 
 
@@ -64,7 +125,61 @@ class TestManifestCompleteness:
         assert len(COPILOT_MANIFEST) > 0
 
     def test_all_templates_have_content(self):
-        for template_module, _ in MANIFEST + CLAUDE_MANIFEST + COPILOT_MANIFEST:
-            assert hasattr(template_module, "CONTENT"), (
-                f"{template_module} missing CONTENT attribute"
+        for template_name, _ in MANIFEST + CLAUDE_MANIFEST + COPILOT_MANIFEST:
+            assert hasattr(load_template(template_name), "CONTENT"), (
+                f"{template_name} missing CONTENT attribute"
             )
+
+
+class TestLazyLoading:
+    def test_package_import_does_not_load_templates(self):
+        """Importing the package should not import any template submodule."""
+        code = (
+            "import sys, create_microservice.templates; "
+            "print(sorted(m for m in sys.modules "
+            "if m.startswith('create_microservice.templates.')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code], capture_output=True, text=True, check=True
+        )
+        assert result.stdout.strip() == "[]"
+
+
+class TestCopyAsset:
+    def test_copies_package_data(self, tmp_path):
+        destination = tmp_path / "AGENT.md"
+        copy_asset("agent_md.md", destination)
+        assert destination.read_bytes() == load_template("agent_md").get_bytes()
+        assert list(tmp_path.iterdir()) == [destination]
+
+    def test_failed_copy_leaves_nothing_behind(self, tmp_path):
+        with pytest.raises(FileNotFoundError):
+            copy_asset("no_such_asset.md", tmp_path / "OUT.md")
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestAgentMd:
+    def test_content_is_read_from_package_data(self):
+        agent_md = load_template("agent_md")
+        assert agent_md.get_content().startswith("# AGENT.md: usvc-lib Microservice")
+
+    def test_sections_are_indexed_by_title(self):
+        agent_md = load_template("agent_md")
+        titles = agent_md.section_titles()
+        assert len(titles) == 15
+        assert titles[2] == "Quick Start Template"
+
+        quick_start = agent_md.section("Quick Start Template")
+        assert quick_start.startswith("## 3. Quick Start Template\n")
+        assert "\n## " not in quick_start
+        assert quick_start in agent_md.get_content()
+
+    def test_unknown_section_raises(self):
+        with pytest.raises(KeyError):
+            load_template("agent_md").section("No Such Section")
+
+    def test_no_redundant_whitespace(self):
+        """The shipped markdown should carry no blank-line runs or trailing spaces."""
+        content = load_template("agent_md").get_content()
+        assert "\n\n\n" not in content
+        assert not any(line != line.rstrip() for line in content.splitlines())